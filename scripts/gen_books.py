@@ -0,0 +1,43 @@
+"""Generate src/clible/data/_bible_structure.py from bible_structure.json.
+
+The book structure is static data shipped with the package, so instead of
+parsing JSON at runtime we bake it into a Python module: importing the
+cached .pyc is a single mmap + unmarshal. Re-run this script after editing
+bible_structure.json:
+
+    python scripts/gen_books.py
+"""
+
+import json
+from operator import itemgetter
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "src" / "clible" / "data"
+
+HEADER = '''\
+"""Static Bible structure rows, generated from bible_structure.json.
+
+Do not edit by hand -- run scripts/gen_books.py after changing the JSON.
+Each row is (id, name, testament, position, chapters), matching the
+books table columns.
+"""
+
+BOOKS: tuple[tuple[int, str, str, int, int], ...] = (
+'''
+
+
+def main() -> None:
+    books = json.loads((DATA_DIR / "bible_structure.json").read_text(encoding="utf-8"))["books"]
+
+    _row = itemgetter("id", "name", "testament", "position", "chapters")
+    lines = [HEADER]
+    for row in map(_row, books):
+        lines.append(f"    {row!r},\n")
+    lines.append(")\n")
+
+    (DATA_DIR / "_bible_structure.py").write_text("".join(lines), encoding="utf-8")
+    print(f"Wrote {len(books)} books to {DATA_DIR / '_bible_structure.py'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,13 @@ via CLIBLE_* env vars so the same code works in every environment:
 - Docker: Pass -e CLIBLE_* or use env_file in compose/run.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Immutable configuration for the clible application.
 
@@ -37,33 +38,36 @@ class Config:
     request_delay: int
 
 
-_default_data_dir = Path(__file__).resolve().parent / "data"
-_data_dir = Path(os.environ.get("CLIBLE_DATA_DIR", str(_default_data_dir)))
-_db_path = (
-    Path(os.environ["CLIBLE_DB_PATH"])
-    if "CLIBLE_DB_PATH" in os.environ
-    else _data_dir / "clible.db"
-)
-_translations_raw = os.environ.get("CLIBLE_TRANSLATIONS", "KJV,ESV,NIV")
-_translations = [s.strip() for s in _translations_raw.split(",") if s.strip()]
-
-config = Config(
-    db_path=_db_path,
-    api_base_url=os.environ.get("CLIBLE_API_BASE_URL", "https://api.bible-api.com"),
-    translations=_translations,
-    data_dir=_data_dir,
-    request_timeout=int(os.environ.get("CLIBLE_REQUEST_TIMEOUT", "10")),
-    request_delay=int(os.environ.get("CLIBLE_REQUEST_DELAY", "1")),
-)
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """Return the global configuration instance.
 
-    Use this instead of importing the config object directly so that
-    tests or alternate entry points can inject a different config if needed.
+    Built lazily from the environment on first call and memoized, so importing
+    this module has no side effects and repeated calls skip the env lookups.
+    Use this instead of module-level globals so that tests or alternate entry
+    points can inject a different config if needed (call
+    ``get_config.cache_clear()`` after changing CLIBLE_* env vars).
 
     Returns:
         The application Config (paths, API URL, translations, timeouts).
     """
-    return config
+    # os.path here instead of Path chaining: fewer allocations and stat
+    # calls on the startup path; only the final Config fields are Paths.
+    _default_data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+    _data_dir = Path(os.environ.get("CLIBLE_DATA_DIR", _default_data_dir))
+    _db_path = (
+        Path(os.environ["CLIBLE_DB_PATH"])
+        if "CLIBLE_DB_PATH" in os.environ
+        else _data_dir / "clible.db"
+    )
+    _translations_raw = os.environ.get("CLIBLE_TRANSLATIONS", "KJV,ESV,NIV")
+    _translations = [t for s in _translations_raw.split(",") if (t := s.strip())]
+
+    return Config(
+        db_path=_db_path,
+        api_base_url=os.environ.get("CLIBLE_API_BASE_URL", "https://api.bible-api.com"),
+        translations=_translations,
+        data_dir=_data_dir,
+        request_timeout=int(os.environ.get("CLIBLE_REQUEST_TIMEOUT", "10")),
+        request_delay=int(os.environ.get("CLIBLE_REQUEST_DELAY", "1")),
+    )
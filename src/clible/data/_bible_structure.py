@@ -0,0 +1,75 @@
+"""Static Bible structure rows, generated from bible_structure.json.
+
+Do not edit by hand -- run scripts/gen_books.py after changing the JSON.
+Each row is (id, name, testament, position, chapters), matching the
+books table columns.
+"""
+
+BOOKS: tuple[tuple[int, str, str, int, int], ...] = (
+    (1, 'Genesis', 'OT', 1, 50),
+    (2, 'Exodus', 'OT', 2, 40),
+    (3, 'Leviticus', 'OT', 3, 27),
+    (4, 'Numbers', 'OT', 4, 36),
+    (5, 'Deuteronomy', 'OT', 5, 34),
+    (6, 'Joshua', 'OT', 6, 24),
+    (7, 'Judges', 'OT', 7, 21),
+    (8, 'Ruth', 'OT', 8, 4),
+    (9, '1 Samuel', 'OT', 9, 31),
+    (10, '2 Samuel', 'OT', 10, 24),
+    (11, '1 Kings', 'OT', 11, 22),
+    (12, '2 Kings', 'OT', 12, 25),
+    (13, '1 Chronicles', 'OT', 13, 29),
+    (14, '2 Chronicles', 'OT', 14, 36),
+    (15, 'Ezra', 'OT', 15, 10),
+    (16, 'Nehemiah', 'OT', 16, 13),
+    (17, 'Esther', 'OT', 17, 10),
+    (18, 'Job', 'OT', 18, 42),
+    (19, 'Psalms', 'OT', 19, 150),
+    (20, 'Proverbs', 'OT', 20, 31),
+    (21, 'Ecclesiastes', 'OT', 21, 12),
+    (22, 'Song of Solomon', 'OT', 22, 8),
+    (23, 'Isaiah', 'OT', 23, 66),
+    (24, 'Jeremiah', 'OT', 24, 52),
+    (25, 'Lamentations', 'OT', 25, 5),
+    (26, 'Ezekiel', 'OT', 26, 48),
+    (27, 'Daniel', 'OT', 27, 12),
+    (28, 'Hosea', 'OT', 28, 14),
+    (29, 'Joel', 'OT', 29, 3),
+    (30, 'Amos', 'OT', 30, 9),
+    (31, 'Obadiah', 'OT', 31, 1),
+    (32, 'Jonah', 'OT', 32, 4),
+    (33, 'Micah', 'OT', 33, 7),
+    (34, 'Nahum', 'OT', 34, 3),
+    (35, 'Habakkuk', 'OT', 35, 3),
+    (36, 'Zephaniah', 'OT', 36, 3),
+    (37, 'Haggai', 'OT', 37, 2),
+    (38, 'Zechariah', 'OT', 38, 14),
+    (39, 'Malachi', 'OT', 39, 4),
+    (40, 'Matthew', 'NT', 40, 28),
+    (41, 'Mark', 'NT', 41, 16),
+    (42, 'Luke', 'NT', 42, 24),
+    (43, 'John', 'NT', 43, 21),
+    (44, 'Acts', 'NT', 44, 28),
+    (45, 'Romans', 'NT', 45, 16),
+    (46, '1 Corinthians', 'NT', 46, 16),
+    (47, '2 Corinthians', 'NT', 47, 13),
+    (48, 'Galatians', 'NT', 48, 6),
+    (49, 'Ephesians', 'NT', 49, 6),
+    (50, 'Philippians', 'NT', 50, 4),
+    (51, 'Colossians', 'NT', 51, 4),
+    (52, '1 Thessalonians', 'NT', 52, 5),
+    (53, '2 Thessalonians', 'NT', 53, 3),
+    (54, '1 Timothy', 'NT', 54, 6),
+    (55, '2 Timothy', 'NT', 55, 4),
+    (56, 'Titus', 'NT', 56, 3),
+    (57, 'Philemon', 'NT', 57, 1),
+    (58, 'Hebrews', 'NT', 58, 13),
+    (59, 'James', 'NT', 59, 5),
+    (60, '1 Peter', 'NT', 60, 5),
+    (61, '2 Peter', 'NT', 61, 3),
+    (62, '1 John', 'NT', 62, 5),
+    (63, '2 John', 'NT', 63, 1),
+    (64, '3 John', 'NT', 64, 1),
+    (65, 'Jude', 'NT', 65, 1),
+    (66, 'Revelation', 'NT', 66, 22),
+)
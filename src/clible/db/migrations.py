@@ -1,18 +1,55 @@
+import functools
+import os
 import sqlite3
 from pathlib import Path
 
+# (connection, migrations dir) pairs known to be fully migrated, so repeat
+# calls on the same connection skip the directory scan and _migrations
+# query. Holds the connection objects themselves (not id()s, which CPython
+# reuses after GC).
+_up_to_date: set[tuple[sqlite3.Connection, str]] = set()
+
+
+def _is_pragma_only(sql: str) -> bool:
+    """Whether every non-comment line of a migration is a PRAGMA statement."""
+    code = [line.strip() for line in sql.splitlines()]
+    code = [line for line in code if line and not line.startswith("--")]
+    return bool(code) and all(line.upper().startswith("PRAGMA") for line in code)
+
+
+@functools.lru_cache(maxsize=8)
+def _migration_names(dir_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """Sorted .sql filenames in dir_str, cached per directory mtime.
+
+    The mtime_ns argument exists purely to key the cache: adding or
+    removing a migration file bumps the directory mtime and forces a
+    fresh scan, while repeat calls on an unchanged directory are a dict
+    lookup instead of a readdir.
+    """
+    return tuple(
+        sorted(entry.name for entry in os.scandir(dir_str) if entry.name.endswith(".sql"))
+    )
+
 
 def run_migrations(conn: sqlite3.Connection, migrations_dir: Path | None = None) -> None:
     """Apply all not-yet-applied migration files in order.
 
-    Creates the _migrations table if missing, then for each .sql file in
-    migrations_dir (sorted by filename), runs it only if its name is not
-    already in _migrations, and records the name after a successful run.
+    Creates the _migrations table if missing, then runs every .sql file in
+    migrations_dir (sorted by filename) whose name is not already in
+    _migrations, and records the applied names.
+
+    All pending migrations run inside a single transaction, so a fresh DB
+    bootstrap costs one commit instead of one per file, and a failure
+    leaves no half-applied state behind.
     """
-    cursor = conn.cursor()
     if migrations_dir is None:
         migrations_dir = Path(__file__).resolve().parent / "migrations"
 
+    key = (conn, str(migrations_dir))
+    if key in _up_to_date:
+        return
+
+    cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS _migrations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -22,19 +59,44 @@ def run_migrations(conn: sqlite3.Connection, migrations_dir: Path | None = None)
     """)
 
     applied = {row[0] for row in cursor.execute("SELECT name FROM _migrations").fetchall()}
-    migration_files = sorted(migrations_dir.glob("*.sql"), key=lambda p: p.name)
+    migration_names = _migration_names(str(migrations_dir), os.stat(migrations_dir).st_mtime_ns)
 
-    for path in migration_files:
-        if path.name in applied:
+    pending = []
+    for name in migration_names:
+        if name in applied:
             continue
-        with open(path, encoding="utf-8") as f:
-            sql = f.read().strip()
+        # Binary read + decode: skips the TextIOWrapper's incremental codec
+        # and newline translation for these small one-shot reads.
+        with open(os.path.join(migrations_dir, name), "rb") as f:
+            pending.append((name, f.read().decode("utf-8").strip()))
+
+    if not pending:
+        _up_to_date.add(key)
+        return
+
+    # Concatenate the pending files into one BEGIN/COMMIT script: one VDBE
+    # program and a single fsync instead of an implicit commit per file.
+    # Pragma-only migrations (e.g. 000_pragmas.sql) go before the BEGIN,
+    # since settings like journal_mode cannot change inside a transaction.
+    # "\n;" (not a bare ";") terminates files whose last line is a comment.
+    pragma_parts = []
+    txn_parts = []
+    for _, sql in pending:
         if sql:
-            cursor.executescript(sql)
-        cursor.execute(
-            "INSERT INTO _migrations (name) VALUES (?)",
-            (path.name,),
-        )
-        applied.add(path.name)
+            part = sql if sql.endswith(";") else sql + "\n;"
+            (pragma_parts if _is_pragma_only(sql) else txn_parts).append(part)
+
+    script = "\n".join(pragma_parts)
+    if txn_parts:
+        script += "\nBEGIN;\n" + "\n".join(txn_parts) + "\nCOMMIT;"
+    cursor.executescript(script)
 
-    conn.commit()
+    # Explicit BEGIN/COMMIT: connections are opened in autocommit mode
+    # (isolation_level=None), so without it every recorded name would fsync.
+    cursor.execute("BEGIN")
+    cursor.executemany(
+        "INSERT INTO _migrations (name) VALUES (?)",
+        [(name,) for name, _ in pending],
+    )
+    cursor.execute("COMMIT")
+    _up_to_date.add(key)
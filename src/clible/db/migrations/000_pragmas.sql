@@ -0,0 +1,4 @@
+-- Persistent database settings. journal_mode=WAL is stored in the DB
+-- file itself and survives across connections, so it is set once here
+-- instead of on every connection open.
+PRAGMA journal_mode=WAL;
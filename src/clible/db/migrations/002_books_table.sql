@@ -0,0 +1,9 @@
+-- Books table for the static Bible structure (seeded from
+-- data/bible_structure.json by clible.db.seed_books).
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    testament TEXT NOT NULL CHECK (testament IN ('OT', 'NT')),
+    position INTEGER NOT NULL UNIQUE,
+    chapters INTEGER NOT NULL
+);
@@ -0,0 +1,43 @@
+"""Seed the books table from the packaged Bible structure data.
+
+The 66-book structure is static, public data baked into the package as a
+generated Python module (clible.data._bible_structure, built by
+scripts/gen_books.py from bible_structure.json), so seeding never parses
+JSON at runtime. Seeding runs on every connection open, so the
+per-connection emptiness check is cached.
+"""
+
+import sqlite3
+
+from clible.data._bible_structure import BOOKS
+
+# Connections already verified as seeded, so repeated seed calls on the
+# same connection skip even the emptiness probe. Holds the connection
+# objects themselves (not id()s, which CPython reuses after GC).
+_seeded_conns: set[sqlite3.Connection] = set()
+
+
+def seed_books_if_empty(conn: sqlite3.Connection) -> None:
+    """Insert the full book list into the books table if it is empty.
+
+    Idempotent: does nothing when the table already has rows, and repeat
+    calls on the same connection return immediately without touching SQLite.
+    """
+    if conn in _seeded_conns:
+        return
+
+    cursor = conn.cursor()
+    # LIMIT 1 probe instead of COUNT(*): stops at the first row rather
+    # than scanning the whole table just to learn "not empty".
+    if cursor.execute("SELECT 1 FROM books LIMIT 1").fetchone() is None:
+        # Explicit BEGIN/COMMIT: connections are opened in autocommit mode
+        # (isolation_level=None), so without it every row would fsync.
+        cursor.execute("BEGIN")
+        cursor.executemany(
+            "INSERT INTO books (id, name, testament, position, chapters)"
+            " VALUES (?, ?, ?, ?, ?)",
+            BOOKS,
+        )
+        cursor.execute("COMMIT")
+
+    _seeded_conns.add(conn)
@@ -1,6 +1,6 @@
 import sqlite3
 
-from clible.db.connection import get_connection
+from clible.db.connection import close_all_connections, get_connection
 
 
 def test_get_connection(tmp_path):
@@ -16,9 +16,28 @@ def test_get_connection(tmp_path):
     cursor.execute("PRAGMA journal_mode")
     assert cursor.fetchone()[0] == "wal"
 
+    cursor.execute("PRAGMA synchronous")
+    assert cursor.fetchone()[0] == 1  # NORMAL
+
     cursor.execute("PRAGMA foreign_keys")
     assert cursor.fetchone()[0] == 1
 
     assert conn.row_factory is sqlite3.Row
 
     conn.close()
+
+
+def test_get_connection_pools_per_path(tmp_path):
+    """Repeat calls for the same path return the same warm connection."""
+    test_db = tmp_path / "test.db"
+    conn1 = get_connection(test_db)
+    conn2 = get_connection(test_db)
+    assert conn1 is conn2
+
+    # A closed pooled connection must be detected and rebuilt.
+    conn1.close()
+    conn3 = get_connection(test_db)
+    assert conn3 is not conn1
+    conn3.execute("SELECT 1")
+
+    close_all_connections()
@@ -0,0 +1,39 @@
+"""Tests for seeding the books table (seed_books_if_empty).
+
+Seeding runs automatically inside get_connection(), so these tests go
+through get_connection with a temporary file DB and assert on the
+resulting books table.
+"""
+
+from clible.db.connection import get_connection
+from clible.db.seed_books import seed_books_if_empty
+
+
+def test_fresh_database_gets_all_books(tmp_path):
+    """A new DB should end up with all 66 books after get_connection()."""
+    conn = get_connection(tmp_path / "test.db")
+
+    count = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+    assert count == 66
+
+    genesis = conn.execute("SELECT * FROM books WHERE id = 1").fetchone()
+    assert genesis["name"] == "Genesis"
+    assert genesis["testament"] == "OT"
+    assert genesis["chapters"] == 50
+
+    revelation = conn.execute("SELECT * FROM books WHERE id = 66").fetchone()
+    assert revelation["name"] == "Revelation"
+    assert revelation["testament"] == "NT"
+
+    conn.close()
+
+
+def test_seeding_is_idempotent(tmp_path):
+    """Re-seeding an already populated DB must not insert duplicate rows."""
+    conn = get_connection(tmp_path / "test.db")
+    seed_books_if_empty(conn)
+
+    count = conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+    assert count == 66
+
+    conn.close()